@@ -0,0 +1,239 @@
+# cython: language_level=3
+"""
+Cython extension for the Roll dice library.
+
+Calls the dice.h entry points directly instead of going through libffi, so
+each roll costs a plain C call rather than a ctypes dispatch with per-argument
+marshalling. dice.py uses this module when it is built and falls back to
+ctypes otherwise.
+"""
+
+from cpython cimport array
+from libc.stdint cimport uint32_t
+from libc.stdlib cimport malloc, free
+
+import array
+
+# Batches at least this large release the GIL while rolling, so other Python
+# threads can run; for smaller ones the release/reacquire costs more than
+# it frees up
+cdef int NOGIL_MIN_COUNT = 4096
+
+cdef extern from "dice.h" nogil:
+    ctypedef struct dice_state_t:
+        pass
+
+    dice_state_t* dice_state_create(uint32_t seed)
+    void dice_state_destroy(dice_state_t *state)
+    int dice_state_roll(dice_state_t *state, int sides)
+    int dice_state_roll_multiple(dice_state_t *state, int count, int sides)
+    int dice_state_roll_individual(dice_state_t *state, int count, int sides, int *results)
+    int dice_state_roll_batch(dice_state_t *state, int sides, int n, int *out)
+    int dice_state_roll_nd(dice_state_t *state, const int *sides, int n, int *out)
+    int dice_state_roll_mixed(dice_state_t *state, const int *specs, int n_specs, int *sums)
+    int dice_state_roll_notation(dice_state_t *state, const char *dice_notation)
+    const char* dice_version()
+
+
+class DiceError(Exception):
+    """Exception raised for dice library errors"""
+    pass
+
+
+cdef class State:
+    """Owns a dice_state_t handle with its own RNG"""
+    cdef dice_state_t *ptr
+
+    def __cinit__(self, uint32_t seed):
+        self.ptr = dice_state_create(seed)
+        if self.ptr is NULL:
+            raise MemoryError("Could not create dice state")
+
+    def __dealloc__(self):
+        dice_state_destroy(self.ptr)
+
+
+def destroy(State state):
+    """Free a state's handle now rather than when it is garbage collected"""
+    dice_state_destroy(state.ptr)
+    state.ptr = NULL
+
+
+cdef int _roll_individual_into(dice_state_t *ptr, int count, int sides, int *results):
+    """dice_state_roll_individual, releasing the GIL for large counts"""
+    cdef int sum_result
+    if count >= NOGIL_MIN_COUNT:
+        with nogil:
+            sum_result = dice_state_roll_individual(ptr, count, sides, results)
+    else:
+        sum_result = dice_state_roll_individual(ptr, count, sides, results)
+    return sum_result
+
+
+def version():
+    """Get the library version"""
+    return dice_version().decode('utf-8')
+
+
+def roll(State state, int sides):
+    """Roll a single die"""
+    if sides <= 0:
+        raise DiceError(f"Invalid number of sides: {sides}")
+    return dice_state_roll(state.ptr, sides)
+
+
+def roll_multiple(State state, int count, int sides):
+    """Roll multiple dice and return the sum"""
+    cdef dice_state_t *ptr = state.ptr
+    cdef int result
+
+    if count <= 0 or sides <= 0:
+        raise DiceError(f"Invalid parameters: count={count}, sides={sides}")
+    if <long long>count * sides > 0x7FFFFFFF:
+        raise OverflowError("sum of the dice could exceed a C int")
+
+    if count >= NOGIL_MIN_COUNT:
+        with nogil:
+            result = dice_state_roll_multiple(ptr, count, sides)
+    else:
+        result = dice_state_roll_multiple(ptr, count, sides)
+    return result
+
+
+def roll_individual(State state, int count, int sides):
+    """Roll multiple dice and return (sum, list_of_individual_results)"""
+    cdef int sum_result
+    cdef int *results
+
+    if count <= 0 or sides <= 0:
+        raise DiceError(f"Invalid parameters: count={count}, sides={sides}")
+    if <long long>count * sides > 0x7FFFFFFF:
+        raise OverflowError("sum of the dice could exceed a C int")
+
+    results = <int*>malloc(count * sizeof(int))
+    if not results:
+        raise MemoryError()
+
+    try:
+        sum_result = _roll_individual_into(state.ptr, count, sides, results)
+        return sum_result, [results[i] for i in range(count)]
+    finally:
+        free(results)
+
+
+def roll_individual_np(State state, int count, int sides):
+    """Roll multiple dice and return (sum, ndarray_of_individual_results)"""
+    cdef int sum_result
+    cdef int[::1] view
+
+    import numpy as np
+
+    if count <= 0 or sides <= 0:
+        raise DiceError(f"Invalid parameters: count={count}, sides={sides}")
+    if <long long>count * sides > 0x7FFFFFFF:
+        raise OverflowError("sum of the dice could exceed a C int")
+
+    results = np.empty(count, dtype=np.intc)
+    view = results
+    sum_result = _roll_individual_into(state.ptr, count, sides, &view[0])
+    return sum_result, results
+
+
+def roll_batch(State state, int sides, int n):
+    """Roll a batch of identical dice into an array.array('i')"""
+    cdef array.array results
+    cdef dice_state_t *ptr = state.ptr
+    cdef int *out
+
+    if n <= 0 or sides <= 0:
+        raise DiceError(f"Invalid parameters: sides={sides}, n={n}")
+
+    results = array.clone(array.array('i'), n, zero=False)
+    out = results.data.as_ints
+    if n >= NOGIL_MIN_COUNT:
+        with nogil:
+            dice_state_roll_batch(ptr, sides, n, out)
+    else:
+        dice_state_roll_batch(ptr, sides, n, out)
+    return results
+
+
+def roll_nd(State state, sides):
+    """Roll one die per element of an array of side counts into an ndarray"""
+    cdef const int[::1] sides_view
+    cdef int[::1] out_view
+    cdef dice_state_t *ptr = state.ptr
+    cdef int n
+
+    import numpy as np
+
+    # Validate before casting, which would silently truncate floats and
+    # wrap values outside the int32 range
+    sides = np.asarray(sides)
+    if sides.size == 0:
+        return np.empty(sides.shape, dtype=np.intc)
+    if sides.dtype.kind not in 'iu':
+        raise TypeError(f"sides must have an integer dtype, got {sides.dtype}")
+    n = sides.size
+    if sides.max() > 0x7FFFFFFF:
+        raise OverflowError("value too large to convert to int")
+    if sides.min() <= 0:
+        raise DiceError(f"Invalid parameters: sides must all be > 0, got {sides.min()}")
+
+    # No copy when sides is already a C-contiguous int32 array
+    sides = np.ascontiguousarray(sides, dtype=np.intc)
+    results = np.empty_like(sides)
+
+    sides_view = sides.reshape(-1)
+    out_view = results.reshape(-1)
+    if n >= NOGIL_MIN_COUNT:
+        with nogil:
+            dice_state_roll_nd(ptr, &sides_view[0], n, &out_view[0])
+    else:
+        dice_state_roll_nd(ptr, &sides_view[0], n, &out_view[0])
+    return results
+
+
+def roll_mixed(State state, specs):
+    """Roll (count, sides) groups and return (total, list_of_group_sums)"""
+    cdef array.array flat = array.array('i')
+    cdef int n_specs = len(specs)
+    cdef int total
+    cdef int *sums
+    cdef int *pairs
+    cdef long long max_total = 0
+    cdef int i
+
+    if n_specs == 0:
+        raise DiceError("Invalid parameters: no dice specs")
+
+    flat.extend([value for count, sides in specs for value in (count, sides)])
+
+    # Invalid pairs are left to the C call; only the overflow is checked here
+    pairs = flat.data.as_ints
+    for i in range(n_specs):
+        if pairs[2 * i] > 0 and pairs[2 * i + 1] > 0:
+            max_total += <long long>pairs[2 * i] * pairs[2 * i + 1]
+            if max_total > 0x7FFFFFFF:
+                raise OverflowError("total of the dice could exceed a C int")
+
+    sums = <int*>malloc(n_specs * sizeof(int))
+    if not sums:
+        raise MemoryError()
+
+    try:
+        total = dice_state_roll_mixed(state.ptr, flat.data.as_ints, n_specs, sums)
+        if total == -1:
+            raise DiceError(f"Invalid parameters: specs={list(specs)}")
+        return total, [sums[i] for i in range(n_specs)]
+    finally:
+        free(sums)
+
+
+def roll_notation(State state, str notation):
+    """Roll dice using RPG notation"""
+    cdef bytes notation_bytes = notation.encode('utf-8')
+    cdef int result = dice_state_roll_notation(state.ptr, notation_bytes)
+    if result == -1:
+        raise DiceError(f"Invalid dice notation: {notation}")
+    return result
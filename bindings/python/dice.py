@@ -1,80 +1,417 @@
 """
-Python bindings for the Roll dice library using ctypes.
+Python bindings for the Roll dice library.
+
+Uses the compiled _dice extension (see setup.py) when it is available and
+falls back to ctypes otherwise.
 """
 
+import array
 import ctypes
 import os
-from pathlib import Path
-from typing import List, Optional
+import re
+import struct
+import threading
+from functools import lru_cache
+from typing import List, Optional, Sequence, Union
 
 # Find the shared library
 def _find_library():
     """Find the dice shared library"""
-    current_dir = Path(__file__).parent.parent.parent
+    # Plain string paths: building pathlib objects cost more than the lookups
+    build_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "build")
     
-    # Look in common library locations
+    # Look in common library locations, highest priority first
     possible_paths = [
-        current_dir / "build" / "libdice.so",
-        current_dir / "build" / "libdice.so.1", 
-        current_dir / "build" / "libdice.dll", 
-        current_dir / "build" / "libdice.dylib",
+        os.path.join(build_dir, "libdice.so"),
+        os.path.join(build_dir, "libdice.so.1"),
+        os.path.join(build_dir, "libdice.dll"),
+        os.path.join(build_dir, "libdice.dylib"),
         "/usr/local/lib/libdice.so",
         "/usr/lib/libdice.so"
     ]
     
     for path in possible_paths:
-        if Path(path).exists():
-            return str(path)
+        if os.path.exists(path):
+            return path
     
     raise RuntimeError("Could not find dice library. Please build the C library first.")
 
-# Load the library
-_lib_path = _find_library()
-_lib = ctypes.CDLL(_lib_path)
+# Resolve all symbols at load time; os.RTLD_* only exist on POSIX. The
+# default RTLD_LOCAL keeps libdice's internal symbols out of the global
+# namespace, where other libraries loaded later could bind to them.
+_RTLD_MODE = getattr(os, 'RTLD_NOW', 0)
+
+# Prefer the compiled extension; ctypes is only a fallback
+try:
+    import _dice
+except ImportError:
+    _dice = None
+
+# Return and argument types for every dice.h entry point the bindings call
+_STATE = ctypes.c_void_p
+_INT_ARRAY = ctypes.POINTER(ctypes.c_int)
+_PROTOTYPES = {
+    'dice_state_create': (_STATE, [ctypes.c_uint32]),
+    'dice_state_destroy': (None, [_STATE]),
+    'dice_state_roll': (ctypes.c_int, [_STATE, ctypes.c_int]),
+    'dice_state_roll_multiple': (ctypes.c_int, [_STATE, ctypes.c_int, ctypes.c_int]),
+    'dice_state_roll_individual': (ctypes.c_int, [_STATE, ctypes.c_int, ctypes.c_int, _INT_ARRAY]),
+    'dice_state_roll_batch': (ctypes.c_int, [_STATE, ctypes.c_int, ctypes.c_int, _INT_ARRAY]),
+    'dice_state_roll_nd': (ctypes.c_int, [_STATE, _INT_ARRAY, ctypes.c_int, _INT_ARRAY]),
+    'dice_state_roll_mixed': (ctypes.c_int, [_STATE, _INT_ARRAY, ctypes.c_int, _INT_ARRAY]),
+    'dice_state_roll_notation': (ctypes.c_int, [_STATE, ctypes.c_char_p]),
+    'dice_version': (ctypes.c_char_p, []),
+}
+
+# Calls rolling at least this many dice go through CDLL and release the GIL,
+# matching the extension's NOGIL_MIN_COUNT; shorter calls use PyDLL, which
+# keeps the GIL and skips the release/reacquire around each call
+_NOGIL_MIN_COUNT = 4096
+
+def _load_library(lib_path: str, dll_type=ctypes.CDLL):
+    """Load the dice shared library and declare function signatures
+    
+    CDLL releases the GIL for the duration of every call and PyDLL holds it;
+    both handles share the one loaded library.
+    """
+    lib = dll_type(lib_path, mode=_RTLD_MODE)
+    for name, (restype, argtypes) in _PROTOTYPES.items():
+        func = getattr(lib, name)
+        func.restype = restype
+        func.argtypes = argtypes
+    return lib
+
+if _dice is not None:
+    from _dice import DiceError
+else:
+    _lib_path = _find_library()
+    _lib = _load_library(_lib_path, ctypes.CDLL)
+    _lib_fast = _load_library(_lib_path, ctypes.PyDLL)
+
+    # Bind the function pointers once so calls skip the attribute lookup
+    _dice_state_create = _lib_fast.dice_state_create
+    _dice_state_destroy = _lib_fast.dice_state_destroy
+    _dice_state_roll = _lib_fast.dice_state_roll
+    _dice_state_roll_multiple = _lib_fast.dice_state_roll_multiple
+    _dice_state_roll_individual = _lib_fast.dice_state_roll_individual
+    _dice_state_roll_batch = _lib_fast.dice_state_roll_batch
+    _dice_state_roll_nd = _lib_fast.dice_state_roll_nd
+    _dice_state_roll_notation = _lib_fast.dice_state_roll_notation
+    _dice_version = _lib_fast.dice_version
+
+    # GIL-releasing variants for calls of _NOGIL_MIN_COUNT dice and up
+    _dice_state_roll_multiple_nogil = _lib.dice_state_roll_multiple
+    _dice_state_roll_individual_nogil = _lib.dice_state_roll_individual
+    _dice_state_roll_batch_nogil = _lib.dice_state_roll_batch
+    _dice_state_roll_nd_nogil = _lib.dice_state_roll_nd
+    _dice_state_roll_mixed = _lib.dice_state_roll_mixed
+
+    class DiceError(Exception):
+        """Exception raised for dice library errors"""
+        pass
+
+# ctypes implementations, used when the extension is not built
+
+# Per-thread result buffers, keyed by power-of-two size
+_POOL_MAX_SIZE = 4096
+_tls = threading.local()
+
+# Result counts at which a precompiled struct unpack beats ctypes slicing,
+# and at which a memoryview copy beats both
+_STRUCT_EXTRACT_MIN = 32
+_BULK_EXTRACT_MIN = 512
+
+def _result_buffer(count: int):
+    """Get a ctypes int array with room for at least count results"""
+    if count > _POOL_MAX_SIZE:
+        return (ctypes.c_int * count)()
+    
+    bucket = 1 << (count - 1).bit_length()
+    pool = getattr(_tls, 'buffers', None)
+    if pool is None:
+        pool = _tls.buffers = {}
+    
+    buffer = pool.get(bucket)
+    if buffer is None:
+        buffer = pool[bucket] = (ctypes.c_int * bucket)()
+    return buffer
+
+@lru_cache(maxsize=None)
+def _int_struct(count: int) -> struct.Struct:
+    """Precompiled struct for count native ints"""
+    return struct.Struct(f'{count}i')
+
+def _to_list(buffer, count: int) -> List[int]:
+    """Convert the populated prefix of a ctypes int array to a list"""
+    if count >= _BULK_EXTRACT_MIN:
+        # ctypes arrays export the '<i' format, so go through bytes to get
+        # a native 'i' view
+        return memoryview(buffer).cast('B').cast('i')[:count].tolist()
+    if count >= _STRUCT_EXTRACT_MIN:
+        return list(_int_struct(count).unpack_from(buffer))
+    return buffer[:count]
+
+# Passing many ints *into* the library: build an array.array and wrap its
+# buffer with (c_int * n).from_buffer(arr). The tempting (c_int * n)(*values)
+# unpacks every value as a separate constructor argument and converts
+# each one from Python, which is many times slower for large inputs.
+def _pack_ints(values) -> array.array:
+    """Pack an iterable of ints into a C int array.array"""
+    packed = array.array('i')
+    packed.extend(values)
+    return packed
+
+def _ctypes_state_create(seed: int) -> int:
+    state = _dice_state_create(seed)
+    if not state:
+        raise MemoryError("Could not create dice state")
+    return state
+
+def _ctypes_version() -> str:
+    return _dice_version().decode('utf-8')
+
+# Arguments are validated before the call, so invalid rolls never cross
+# the FFI boundary just to come back as -1. ctypes would silently wrap ints
+# outside the C int range, so those are rejected too, as are rolls whose
+# largest possible sum (count * sides) would overflow the C int result.
+_INT_MAX = 0x7FFFFFFF
+
+def _reject(message: str, *values: int):
+    """Raise for arguments that failed validation
+    
+    Values that do not fit a C int raise OverflowError, as the extension's
+    int conversion does, and so do valid values whose sum could overflow;
+    anything else raises DiceError.
+    """
+    if any(not -_INT_MAX - 1 <= value <= _INT_MAX for value in values):
+        raise OverflowError("value too large to convert to int")
+    if all(value > 0 for value in values):
+        raise OverflowError("sum of the dice could exceed a C int")
+    raise DiceError(message)
+
+def _ctypes_roll(state: int, sides: int) -> int:
+    if not 0 < sides <= _INT_MAX:
+        _reject(f"Invalid number of sides: {sides}", sides)
+    return _dice_state_roll(state, sides)
 
-# Define function signatures
-_lib.dice_init.argtypes = [ctypes.c_uint32]
-_lib.dice_init.restype = None
+def _ctypes_roll_multiple(state: int, count: int, sides: int) -> int:
+    if not (0 < count and 0 < sides and count * sides <= _INT_MAX):
+        _reject(f"Invalid parameters: count={count}, sides={sides}", count, sides)
+    if count >= _NOGIL_MIN_COUNT:
+        return _dice_state_roll_multiple_nogil(state, count, sides)
+    return _dice_state_roll_multiple(state, count, sides)
 
-_lib.dice_roll.argtypes = [ctypes.c_int]
-_lib.dice_roll.restype = ctypes.c_int
+def _ctypes_roll_individual(state: int, count: int, sides: int) -> tuple[int, List[int]]:
+    if not (0 < count and 0 < sides and count * sides <= _INT_MAX):
+        _reject(f"Invalid parameters: count={count}, sides={sides}", count, sides)
+    
+    # Reuse a pooled array for results
+    results_array = _result_buffer(count)
+    
+    roll_into = _dice_state_roll_individual if count < _NOGIL_MIN_COUNT else _dice_state_roll_individual_nogil
+    sum_result = roll_into(state, count, sides, results_array)
+    return sum_result, _to_list(results_array, count)
 
-_lib.dice_roll_multiple.argtypes = [ctypes.c_int, ctypes.c_int]
-_lib.dice_roll_multiple.restype = ctypes.c_int
+def _ctypes_roll_individual_np(state: int, count: int, sides: int):
+    import numpy as np
+    
+    if not (0 < count and 0 < sides and count * sides <= _INT_MAX):
+        _reject(f"Invalid parameters: count={count}, sides={sides}", count, sides)
+    
+    # Roll straight into the ndarray's buffer, no boxing or copy
+    results = np.empty(count, dtype=np.intc)
+    roll_into = _dice_state_roll_individual if count < _NOGIL_MIN_COUNT else _dice_state_roll_individual_nogil
+    sum_result = roll_into(state, count, sides, results.ctypes.data_as(_INT_ARRAY))
+    return sum_result, results
 
-_lib.dice_roll_individual.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_int)]
-_lib.dice_roll_individual.restype = ctypes.c_int
+def _ctypes_roll_batch(state: int, sides: int, n: int) -> array.array:
+    if not (0 < n <= _INT_MAX and 0 < sides <= _INT_MAX):
+        _reject(f"Invalid parameters: sides={sides}, n={n}", sides, n)
+    
+    # Roll straight into the array's buffer, no intermediate copy
+    results = array.array('i', [0]) * n
+    roll_into = _dice_state_roll_batch if n < _NOGIL_MIN_COUNT else _dice_state_roll_batch_nogil
+    roll_into(state, sides, n, (ctypes.c_int * n).from_buffer(results))
+    return results
+
+def _ctypes_roll_nd(state: int, sides):
+    import numpy as np
+    
+    # Validate before casting, which would silently truncate floats and
+    # wrap values outside the int32 range
+    sides = np.asarray(sides)
+    if sides.size == 0:
+        return np.empty(sides.shape, dtype=np.intc)
+    if sides.dtype.kind not in 'iu':
+        raise TypeError(f"sides must have an integer dtype, got {sides.dtype}")
+    if sides.size > _INT_MAX or sides.max() > _INT_MAX:
+        raise OverflowError("value too large to convert to int")
+    if sides.min() <= 0:
+        raise DiceError(f"Invalid parameters: sides must all be > 0, got {sides.min()}")
+    
+    # No copy when sides is already a C-contiguous int32 array
+    sides = np.ascontiguousarray(sides, dtype=np.intc)
+    results = np.empty_like(sides)
+    roll_into = _dice_state_roll_nd if sides.size < _NOGIL_MIN_COUNT else _dice_state_roll_nd_nogil
+    roll_into(state, sides.ctypes.data_as(_INT_ARRAY), sides.size, results.ctypes.data_as(_INT_ARRAY))
+    return results
+
+def _ctypes_roll_mixed(state: int, specs: Sequence[tuple[int, int]]) -> tuple[int, List[int]]:
+    n_specs = len(specs)
+    if n_specs == 0:
+        raise DiceError("Invalid parameters: no dice specs")
+    
+    flat = _pack_ints(value for count, sides in specs for value in (count, sides))
+    if sum(count * sides for count, sides in specs if count > 0 and sides > 0) > _INT_MAX:
+        raise OverflowError("total of the dice could exceed a C int")
+    sums_array = _result_buffer(n_specs)
+    
+    total = _dice_state_roll_mixed(
+        state, (ctypes.c_int * len(flat)).from_buffer(flat), n_specs, sums_array
+    )
+    
+    if total == -1:
+        raise DiceError(f"Invalid parameters: specs={list(specs)}")
+    
+    return total, _to_list(sums_array, n_specs)
 
-_lib.dice_roll_notation.argtypes = [ctypes.c_char_p]
-_lib.dice_roll_notation.restype = ctypes.c_int
+@lru_cache(maxsize=256)
+def _encode(notation: str) -> bytes:
+    """Encode a notation string, cached for hot notations"""
+    return notation.encode('utf-8')
 
-_lib.dice_version.argtypes = []
-_lib.dice_version.restype = ctypes.c_char_p
+# Plain "NdS", "NdS+M" and "NdS-M" notations, rolled without the C parser.
+# The modifier is capped at nine digits so the result always fits a C int.
+_NOTATION_RE = re.compile(r'^\s*(\d+)[dD](\d+)\s*([+-]\s*\d{1,9})?\s*$', re.ASCII)
 
-class DiceError(Exception):
-    """Exception raised for dice library errors"""
-    pass
+# Default policy limits from dice_default_policy(); the C notation arena is
+# sized so these, not memory, bound a single term, keeping both paths in step
+_MAX_DICE_COUNT = 1000
+_MAX_SIDES = 1000000
+
+@lru_cache(maxsize=256)
+def _parse_simple_notation(notation: str) -> Optional[tuple[int, int, int]]:
+    """Parse a plain notation into (count, sides, modifier), or None"""
+    match = _NOTATION_RE.match(notation)
+    if match is None:
+        return None
+    
+    count = int(match.group(1))
+    sides = int(match.group(2))
+    if not (0 < count <= _MAX_DICE_COUNT and 0 < sides <= _MAX_SIDES):
+        return None
+    
+    modifier = match.group(3)
+    return count, sides, int(modifier.replace(' ', '')) if modifier else 0
+
+# Both backends try the simple form first and only hand keep, reroll,
+# exploding and other notations to the C parser. Regex matching alone costs
+# about as much as the C parser, so the parsed form is cached per string.
+def _ctypes_roll_notation(state: int, notation: str) -> int:
+    simple = _parse_simple_notation(notation)
+    if simple is not None:
+        count, sides, modifier = simple
+        return _dice_state_roll_multiple(state, count, sides) + modifier
+    
+    result = _dice_state_roll_notation(state, _encode(notation))
+    if result == -1:
+        raise DiceError(f"Invalid dice notation: {notation}")
+    return result
+
+def _extension_roll_notation(state, notation: str) -> int:
+    simple = _parse_simple_notation(notation)
+    if simple is not None:
+        count, sides, modifier = simple
+        return _dice.roll_multiple(state, count, sides) + modifier
+    return _dice.roll_notation(state, notation)
+
+if _dice is not None:
+    _state_create = _dice.State
+    _state_destroy = _dice.destroy
+    _version = _dice.version
+    _roll = _dice.roll
+    _roll_multiple = _dice.roll_multiple
+    _roll_individual = _dice.roll_individual
+    _roll_individual_np = _dice.roll_individual_np
+    _roll_batch = _dice.roll_batch
+    _roll_nd = _dice.roll_nd
+    _roll_mixed = _dice.roll_mixed
+    _roll_notation = _extension_roll_notation
+else:
+    _state_create = _ctypes_state_create
+    _state_destroy = _dice_state_destroy
+    _version = _ctypes_version
+    _roll = _ctypes_roll
+    _roll_multiple = _ctypes_roll_multiple
+    _roll_individual = _ctypes_roll_individual
+    _roll_individual_np = _ctypes_roll_individual_np
+    _roll_batch = _ctypes_roll_batch
+    _roll_nd = _ctypes_roll_nd
+    _roll_mixed = _ctypes_roll_mixed
+    _roll_notation = _ctypes_roll_notation
+
+# Seed mixing
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+def _splitmix64(x: int) -> int:
+    """One SplitMix64 step: a full 64-bit avalanche of x"""
+    z = (x + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+def _mix_seed(seed: int, spawn_key: Union[int, Sequence[int]] = ()) -> int:
+    """Mix a user seed and optional spawn key into a 32-bit RNG seed
+    
+    Small or sequential seeds (and the same seed with different spawn keys,
+    e.g. one per thread) map to unrelated 32-bit values.
+    """
+    if isinstance(spawn_key, int):
+        spawn_key = (spawn_key,)
+    
+    z = _splitmix64(seed & _MASK64)
+    for key in spawn_key:
+        z = _splitmix64(z ^ (key & _MASK64))
+    
+    # 0 asks the library for a time-based seed, so never produce it
+    return (z & 0xFFFFFFFF) or 1
 
 class Dice:
     """Python interface to the Roll dice library"""
     
-    def __init__(self, seed: Optional[int] = None):
+    __slots__ = ('_seed', '_h')
+    
+    def __init__(self, seed: Optional[int] = None,
+                 spawn_key: Union[int, Sequence[int]] = ()):
         """Initialize the dice library
         
         Args:
             seed: Random seed (None for time-based seed)
+            spawn_key: Extra key, such as a thread index, mixed into seed
+                so generators sharing a seed get distinct streams
+        
+        Raises:
+            ValueError: If spawn_key is given without a seed
         """
-        if seed is None:
-            seed = 0
-        _lib.dice_init(ctypes.c_uint32(seed))
+        if seed is None and (isinstance(spawn_key, int) or len(spawn_key)):
+            raise ValueError("spawn_key requires an explicit seed")
+        
+        # 0 keeps the library's time-based seeding
+        self._seed = 0 if seed is None else _mix_seed(seed, spawn_key)
+        self._h = _state_create(self._seed)
+    
+    def __del__(self):
+        h = getattr(self, '_h', None)
+        if h is not None:
+            self._h = None
+            _state_destroy(h)
     
     @staticmethod
     def version() -> str:
         """Get the library version"""
-        return _lib.dice_version().decode('utf-8')
+        return _version()
     
-    @staticmethod
-    def roll(sides: int) -> int:
+    def roll(self, sides: int) -> int:
         """Roll a single die
         
         Args:
@@ -85,14 +422,11 @@ class Dice:
             
         Raises:
             DiceError: If sides <= 0
+            OverflowError: If an argument does not fit a C int
         """
-        result = _lib.dice_roll(ctypes.c_int(sides))
-        if result == -1:
-            raise DiceError(f"Invalid number of sides: {sides}")
-        return result
+        return _roll(self._h, sides)
     
-    @staticmethod
-    def roll_multiple(count: int, sides: int) -> int:
+    def roll_multiple(self, count: int, sides: int) -> int:
         """Roll multiple dice and return the sum
         
         Args:
@@ -104,14 +438,11 @@ class Dice:
             
         Raises:
             DiceError: If count <= 0 or sides <= 0
+            OverflowError: If an argument or count * sides does not fit a C int
         """
-        result = _lib.dice_roll_multiple(ctypes.c_int(count), ctypes.c_int(sides))
-        if result == -1:
-            raise DiceError(f"Invalid parameters: count={count}, sides={sides}")
-        return result
+        return _roll_multiple(self._h, count, sides)
     
-    @staticmethod
-    def roll_individual(count: int, sides: int) -> tuple[int, List[int]]:
+    def roll_individual(self, count: int, sides: int) -> tuple[int, List[int]]:
         """Roll multiple dice and return individual results
         
         Args:
@@ -123,29 +454,81 @@ class Dice:
             
         Raises:
             DiceError: If count <= 0 or sides <= 0
+            OverflowError: If an argument or count * sides does not fit a C int
         """
-        if count <= 0 or sides <= 0:
-            raise DiceError(f"Invalid parameters: count={count}, sides={sides}")
+        return _roll_individual(self._h, count, sides)
+    
+    def roll_individual_np(self, count: int, sides: int):
+        """Roll multiple dice and return individual results as a NumPy array
         
-        # Create array for results
-        results_array = (ctypes.c_int * count)()
+        Requires NumPy, which is imported on first use.
         
-        sum_result = _lib.dice_roll_individual(
-            ctypes.c_int(count), 
-            ctypes.c_int(sides), 
-            results_array
-        )
+        Args:
+            count: Number of dice to roll
+            sides: Number of sides on each die
+            
+        Returns:
+            Tuple of (sum, int32 ndarray of individual results)
+            
+        Raises:
+            DiceError: If count <= 0 or sides <= 0
+            OverflowError: If an argument or count * sides does not fit a C int
+        """
+        return _roll_individual_np(self._h, count, sides)
+    
+    def roll_batch(self, sides: int, n: int) -> array.array:
+        """Roll a batch of identical dice in a single library call
         
-        if sum_result == -1:
-            raise DiceError(f"Invalid parameters: count={count}, sides={sides}")
+        Args:
+            sides: Number of sides on each die
+            n: Number of dice to roll
+            
+        Returns:
+            array.array of type 'i' holding the n results
+            
+        Raises:
+            DiceError: If sides <= 0 or n <= 0
+            OverflowError: If an argument does not fit a C int
+        """
+        return _roll_batch(self._h, sides, n)
+    
+    def roll_nd(self, sides):
+        """Roll one die per element of a NumPy array of side counts
         
-        # Convert to Python list
-        results = [results_array[i] for i in range(count)]
+        Requires NumPy, which is imported on first use. sides must have an
+        integer dtype; it is converted to a C-contiguous int32 array, without
+        a copy if it already is one.
         
-        return sum_result, results
+        Args:
+            sides: Array-like of side counts, one per die
+            
+        Returns:
+            int32 ndarray of results with the same shape as sides
+            
+        Raises:
+            DiceError: If any side count is <= 0
+            OverflowError: If any side count does not fit a C int
+            TypeError: If sides does not have an integer dtype
+        """
+        return _roll_nd(self._h, sides)
     
-    @staticmethod
-    def roll_notation(notation: str) -> int:
+    def roll_mixed(self, specs: Sequence[tuple[int, int]]) -> tuple[int, List[int]]:
+        """Roll several groups of dice in a single library call
+        
+        Args:
+            specs: (count, sides) pairs, e.g. [(3, 6), (1, 20)] for 3d6 and 1d20
+            
+        Returns:
+            Tuple of (total, list_of_group_sums)
+            
+        Raises:
+            DiceError: If specs is empty or any count or sides is <= 0
+            OverflowError: If any value, or the summed count * sides of all
+                groups, does not fit a C int
+        """
+        return _roll_mixed(self._h, specs)
+    
+    def roll_notation(self, notation: str) -> int:
         """Roll dice using RPG notation
         
         Args:
@@ -157,33 +540,55 @@ class Dice:
         Raises:
             DiceError: If notation is invalid
         """
-        notation_bytes = notation.encode('utf-8')
-        result = _lib.dice_roll_notation(notation_bytes)
-        if result == -1:
-            raise DiceError(f"Invalid dice notation: {notation}")
-        return result
+        return _roll_notation(self._h, notation)
 
-# Convenience functions
-def init(seed: Optional[int] = None):
-    """Initialize the dice library"""
-    Dice(seed)
+# Convenience functions roll on a per-thread default Dice, since one
+# handle must not be used from two threads at once
+_default = threading.local()
+
+def _default_handle():
+    """Get the state handle of the calling thread's default Dice"""
+    dice = getattr(_default, 'dice', None)
+    if dice is None:
+        dice = _default.dice = Dice()
+    return dice._h
+
+def init(seed: Optional[int] = None, spawn_key: Union[int, Sequence[int]] = ()):
+    """Initialize the calling thread's default dice"""
+    _default.dice = Dice(seed, spawn_key)
 
 def version() -> str:
     """Get the library version"""
-    return Dice.version()
+    return _version()
 
 def roll(sides: int) -> int:
     """Roll a single die"""
-    return Dice.roll(sides)
+    return _roll(_default_handle(), sides)
 
 def roll_multiple(count: int, sides: int) -> int:
     """Roll multiple dice and return the sum"""
-    return Dice.roll_multiple(count, sides)
+    return _roll_multiple(_default_handle(), count, sides)
 
 def roll_individual(count: int, sides: int) -> tuple[int, List[int]]:
     """Roll multiple dice and return individual results"""
-    return Dice.roll_individual(count, sides)
+    return _roll_individual(_default_handle(), count, sides)
+
+def roll_individual_np(count: int, sides: int):
+    """Roll multiple dice and return individual results as a NumPy array"""
+    return _roll_individual_np(_default_handle(), count, sides)
+
+def roll_batch(sides: int, n: int) -> array.array:
+    """Roll a batch of identical dice in a single library call"""
+    return _roll_batch(_default_handle(), sides, n)
+
+def roll_nd(sides):
+    """Roll one die per element of a NumPy array of side counts"""
+    return _roll_nd(_default_handle(), sides)
+
+def roll_mixed(specs: Sequence[tuple[int, int]]) -> tuple[int, List[int]]:
+    """Roll several groups of dice in a single library call"""
+    return _roll_mixed(_default_handle(), specs)
 
 def roll_notation(notation: str) -> int:
     """Roll dice using RPG notation"""
-    return Dice.roll_notation(notation)
\ No newline at end of file
+    return _roll_notation(_default_handle(), notation)
\ No newline at end of file
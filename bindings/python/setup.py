@@ -0,0 +1,34 @@
+"""
+Build the optional Cython extension for the Roll dice Python bindings.
+
+Requires Cython and the shared library (cmake -DBUILD_SHARED_LIBS=ON):
+
+    cd bindings/python
+    python setup.py build_ext --inplace
+
+Without the extension, dice.py falls back to ctypes.
+"""
+
+import sys
+from pathlib import Path
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+root_dir = Path(__file__).resolve().parent.parent.parent
+lib_dir = str(root_dir / "build")
+
+dice_extension = Extension(
+    "_dice",
+    sources=["_dice.pyx"],
+    include_dirs=[str(root_dir / "include")],
+    libraries=["dice"],
+    library_dirs=[lib_dir],
+    runtime_library_dirs=[] if sys.platform == "win32" else [lib_dir],
+)
+
+setup(
+    name="roll-dice",
+    py_modules=["dice"],
+    ext_modules=cythonize([dice_extension], language_level=3),
+)
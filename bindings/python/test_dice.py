@@ -2,6 +2,8 @@
 Test the Python bindings for the Roll dice library
 """
 
+import ctypes
+import re
 import sys
 import os
 
@@ -17,6 +19,35 @@ def test_version():
     assert len(version) > 0
     print(f"Library version: {version}")
 
+def test_prototypes_match_header():
+    """Test that the ctypes prototypes match the declarations in dice.h"""
+    header_path = os.path.join(os.path.dirname(__file__), "..", "..", "include", "dice.h")
+    with open(header_path) as f:
+        header = f.read()
+    
+    c_types = {
+        "void": None,
+        "int": ctypes.c_int,
+        "uint32_t": ctypes.c_uint32,
+        "int*": ctypes.POINTER(ctypes.c_int),
+        "constint*": ctypes.POINTER(ctypes.c_int),
+        "constchar*": ctypes.c_char_p,
+        "dice_state_t*": ctypes.c_void_p,
+    }
+    
+    def to_ctype(decl, named=False):
+        if named:
+            decl = re.sub(r"\w+\s*$", "", decl)  # drop the parameter name
+        return c_types[decl.replace(" ", "")]
+    
+    for name, (restype, argtypes) in dice._PROTOTYPES.items():
+        match = re.search(r"^([\w *]+?)\s*\b%s\(([^)]*)\);" % name, header, re.M)
+        assert match, f"{name} is not declared in dice.h"
+        
+        params = [p for p in match.group(2).split(",") if p.strip() not in ("", "void")]
+        assert to_ctype(match.group(1)) == restype, f"{name} return type differs from dice.h"
+        assert [to_ctype(p, named=True) for p in params] == argtypes, f"{name} arguments differ from dice.h"
+
 def test_initialization():
     """Test library initialization"""
     # Test with seed
@@ -28,6 +59,31 @@ def test_initialization():
     # Test with None
     dice.init(None)
 
+def test_seed_mixing():
+    """Test seed mixing for distinct, reproducible seeds"""
+    seeds = {dice.Dice(seed)._seed for seed in range(100)}
+    assert len(seeds) == 100
+    assert all(0 < seed <= 0xFFFFFFFF for seed in seeds)
+    
+    # Same seed and key always mix the same way
+    assert dice.Dice(12345, spawn_key=1)._seed == dice.Dice(12345, spawn_key=1)._seed
+    
+    # Spawn keys split one seed into distinct streams
+    keyed = {dice.Dice(12345, spawn_key=key)._seed for key in range(100)}
+    assert len(keyed) == 100
+    assert dice.Dice(12345, spawn_key=(1, 2))._seed != dice.Dice(12345, spawn_key=(2, 1))._seed
+    
+    # A key has nothing to mix into without a seed
+    for key in (0, 1, (1, 2)):
+        try:
+            dice.Dice(None, spawn_key=key)
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+    
+    # None keeps the library's time-based seeding
+    assert dice.Dice(None)._seed == 0
+
 def test_single_roll():
     """Test single die roll"""
     dice.init(12345)
@@ -52,6 +108,49 @@ def test_single_roll():
     except dice.DiceError:
         pass
 
+def test_out_of_range_arguments():
+    """Test that arguments outside the C int range are rejected, not wrapped"""
+    d = dice.Dice(3)
+    
+    for call in (lambda: d.roll(2**32 - 1),
+                 lambda: d.roll(-2**40),
+                 lambda: d.roll_multiple(2**32 - 1, 6),
+                 lambda: d.roll_multiple(2**32 + 3, 6),
+                 lambda: d.roll_individual(3, 2**31),
+                 lambda: d.roll_batch(6, 2**31)):
+        try:
+            call()
+            assert False, "Expected OverflowError"
+        except OverflowError:
+            pass
+
+def test_sum_overflow():
+    """Test that rolls whose sum could exceed a C int are rejected"""
+    d = dice.Dice(5)
+    
+    for call in (lambda: d.roll_multiple(100000, 2**31 - 1),
+                 lambda: d.roll_multiple(2, 2**30 + 1),
+                 lambda: d.roll_individual(100000, 2**31 - 1)):
+        try:
+            call()
+            assert False, "Expected OverflowError"
+        except OverflowError:
+            pass
+    
+    # roll_mixed bounds the total across all groups
+    for specs in ([(1000000, 1000000), (1000000, 1000000)],
+                  [(1, 2**31 - 1), (1, 2**31 - 1)]):
+        try:
+            d.roll_mixed(specs)
+            assert False, "Expected OverflowError"
+        except OverflowError:
+            pass
+    
+    # The largest sum that fits is still allowed
+    assert 2 <= d.roll_multiple(2, 2**30 - 1) <= 2**31 - 2
+    total, rolls = d.roll_individual(1, 2**31 - 1)
+    assert total == sum(rolls)
+
 def test_multiple_rolls():
     """Test multiple dice rolls"""
     dice.init(12345)
@@ -63,12 +162,22 @@ def test_multiple_rolls():
     result = dice.roll_multiple(1, 20)
     assert 1 <= result <= 20
     
+    # Large counts release the GIL during the call
+    result = dice.roll_multiple(5000, 6)
+    assert 5000 <= result <= 30000
+    
     # Test invalid rolls
     try:
         dice.roll_multiple(0, 6)
         assert False, "Expected DiceError"
     except dice.DiceError:
         pass
+    
+    try:
+        dice.roll_multiple(3, 0)
+        assert False, "Expected DiceError"
+    except dice.DiceError:
+        pass
 
 def test_individual_rolls():
     """Test individual dice rolls"""
@@ -87,6 +196,118 @@ def test_individual_rolls():
     assert len(individual) == 1
     assert individual[0] == sum_result
 
+def test_individual_rolls_sizes():
+    """Test individual rolls across repeated and varying counts"""
+    dice.init(12345)
+    
+    for count in (1, 2, 3, 5, 3, 1, 32, 100, 511, 512, 4096, 4097, 2):
+        sum_result, individual = dice.roll_individual(count, 6)
+        assert len(individual) == count
+        assert all(1 <= roll <= 6 for roll in individual)
+        assert sum(individual) == sum_result
+
+def test_individual_rolls_np():
+    """Test individual dice rolls into a NumPy array"""
+    try:
+        import numpy
+    except ImportError:
+        print("NumPy not installed, skipping roll_individual_np test")
+        return
+    
+    dice.init(12345)
+    
+    sum_result, individual = dice.roll_individual_np(1000, 6)
+    assert isinstance(individual, numpy.ndarray)
+    assert individual.shape == (1000,)
+    assert individual.min() >= 1 and individual.max() <= 6
+    assert int(individual.sum()) == sum_result
+    
+    # Test invalid rolls
+    try:
+        dice.roll_individual_np(0, 6)
+        assert False, "Expected DiceError"
+    except dice.DiceError:
+        pass
+
+def test_nd_rolls():
+    """Test heterogeneous dice rolls from a NumPy array of sides"""
+    try:
+        import numpy
+    except ImportError:
+        print("NumPy not installed, skipping roll_nd test")
+        return
+    
+    dice.init(12345)
+    
+    sides = numpy.array([[4, 6, 8], [10, 12, 20]] * 500, dtype=numpy.int32)
+    results = dice.roll_nd(sides)
+    assert isinstance(results, numpy.ndarray)
+    assert results.shape == sides.shape
+    assert (results >= 1).all() and (results <= sides).all()
+    
+    # Non-contiguous and non-int32 input is converted
+    assert dice.roll_nd(sides[:, ::2].astype(numpy.int64)).shape == (1000, 2)
+    assert dice.roll_nd([6, 20]).shape == (2,)
+    assert dice.roll_nd(numpy.array([], dtype=numpy.int32)).shape == (0,)
+    
+    # Test invalid rolls
+    try:
+        dice.roll_nd([6, 0, 20])
+        assert False, "Expected DiceError"
+    except dice.DiceError:
+        pass
+    
+    # Values that would wrap or truncate in the int32 cast are rejected
+    for bad, error in ((numpy.array([2**32 + 6], dtype=numpy.int64), OverflowError),
+                       (numpy.array([2**31]), OverflowError),
+                       (numpy.array([6.9, 2.5]), TypeError),
+                       (numpy.array([True, True]), TypeError)):
+        try:
+            dice.roll_nd(bad)
+            assert False, f"Expected {error.__name__}"
+        except error:
+            pass
+
+def test_batch_rolls():
+    """Test batch dice rolls"""
+    dice.init(12345)
+    
+    results = dice.roll_batch(20, 1000)
+    assert len(results) == 1000
+    assert all(1 <= roll <= 20 for roll in results)
+    
+    # Test invalid rolls
+    try:
+        dice.roll_batch(20, 0)
+        assert False, "Expected DiceError"
+    except dice.DiceError:
+        pass
+    
+    try:
+        dice.roll_batch(0, 10)
+        assert False, "Expected DiceError"
+    except dice.DiceError:
+        pass
+
+def test_mixed_rolls():
+    """Test rolling several groups of dice at once"""
+    dice.init(12345)
+    
+    total, sums = dice.roll_mixed([(3, 6), (1, 20), (2, 4)])
+    assert len(sums) == 3
+    assert 3 <= sums[0] <= 18
+    assert 1 <= sums[1] <= 20
+    assert 2 <= sums[2] <= 8
+    assert sum(sums) == total
+    
+    # Test invalid rolls
+    for specs in ([], [(3, 6), (0, 20)], [(3, -6)]):
+        try:
+            dice.roll_mixed(specs)
+            assert False, "Expected DiceError"
+        except dice.DiceError:
+            pass
+
 def test_notation_rolls():
     """Test RPG notation rolls"""
     dice.init(12345)
@@ -109,7 +330,36 @@ def test_notation_rolls():
     result = dice.roll_notation("1D6")
     assert 1 <= result <= 6
     
+    # Test whitespace
+    result = dice.roll_notation(" 3d6 + 2 ")
+    assert 5 <= result <= 20
+    
+    # Simple notations roll the same dice as roll_multiple
+    assert dice.Dice(7).roll_notation("3d6+2") == dice.Dice(7).roll_multiple(3, 6) + 2
+    
+    # Notations outside the simple form still go through the C parser
+    result = dice.roll_notation("4d6k3")
+    assert 3 <= result <= 18
+    
+    # The fast path and the C parser accept the same dice counts
+    for count in (1, 69, 70, 1000, 1001):
+        accepted = []
+        for notation in (f"{count}d6", f"{count}d6k{count}"):
+            try:
+                dice.roll_notation(notation)
+                accepted.append(True)
+            except dice.DiceError:
+                accepted.append(False)
+        assert accepted == [count <= 1000] * 2, f"{count} dice: {accepted}"
+    
     # Test invalid notation
+    for notation in ("0d6", "3d0", "1001d6"):
+        try:
+            dice.roll_notation(notation)
+            assert False, "Expected DiceError"
+        except dice.DiceError:
+            pass
+    
     try:
         dice.roll_notation("invalid")
         assert False, "Expected DiceError"
@@ -119,6 +369,7 @@ def test_notation_rolls():
 def test_class_interface():
     """Test the Dice class interface"""
     d = dice.Dice(12345)
+    assert not hasattr(d, '__dict__')
     
     result = d.roll(6)
     assert 1 <= result <= 6
@@ -132,15 +383,67 @@ def test_class_interface():
     result = d.roll_notation("2d6+3")
     assert 5 <= result <= 15
 
+def test_seeded_reproducibility():
+    """Test that equal seeds roll equal sequences"""
+    d1 = dice.Dice(42)
+    d2 = dice.Dice(42)
+    
+    assert [d1.roll(20) for _ in range(20)] == [d2.roll(20) for _ in range(20)]
+    assert d1.roll_multiple(3, 6) == d2.roll_multiple(3, 6)
+    assert d1.roll_individual(4, 6) == d2.roll_individual(4, 6)
+    assert list(d1.roll_batch(6, 100)) == list(d2.roll_batch(6, 100))
+    assert d1.roll_notation("4d6k3") == d2.roll_notation("4d6k3")
+    
+    # Module-level functions follow init()
+    dice.init(42)
+    first = [dice.roll(20) for _ in range(20)]
+    dice.init(42)
+    assert [dice.roll(20) for _ in range(20)] == first
+
+def test_threaded_rolls():
+    """Test rolling from several threads, each with its own dice"""
+    import threading
+    
+    errors = []
+    
+    def worker(index):
+        try:
+            d = dice.Dice(12345, spawn_key=index)
+            for _ in range(200):
+                assert 1 <= d.roll(6) <= 6
+                assert 1 <= d.roll_notation("1d20") <= 20
+                assert 3 <= dice.roll_multiple(3, 6) <= 18
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert not errors
+
 if __name__ == "__main__":
     print("Running Python dice library tests...")
     
     test_version()
+    test_prototypes_match_header()
     test_initialization()
+    test_seed_mixing()
     test_single_roll()
+    test_out_of_range_arguments()
+    test_sum_overflow()
     test_multiple_rolls()
     test_individual_rolls()
+    test_individual_rolls_sizes()
+    test_individual_rolls_np()
+    test_nd_rolls()
+    test_batch_rolls()
+    test_mixed_rolls()
     test_notation_rolls()
     test_class_interface()
+    test_seeded_reproducibility()
+    test_threaded_rolls()
     
     print("All Python tests passed!")
\ No newline at end of file
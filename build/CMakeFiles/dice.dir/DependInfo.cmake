@@ -0,0 +1,33 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/src/custom_dice.c" "CMakeFiles/dice.dir/src/custom_dice.c.o" "gcc" "CMakeFiles/dice.dir/src/custom_dice.c.o.d"
+  "/root/package/src/dice.c" "CMakeFiles/dice.dir/src/dice.c.o" "gcc" "CMakeFiles/dice.dir/src/dice.c.o.d"
+  "/root/package/src/eval.c" "CMakeFiles/dice.dir/src/eval.c.o" "gcc" "CMakeFiles/dice.dir/src/eval.c.o.d"
+  "/root/package/src/memory.c" "CMakeFiles/dice.dir/src/memory.c.o" "gcc" "CMakeFiles/dice.dir/src/memory.c.o.d"
+  "/root/package/src/parser.c" "CMakeFiles/dice.dir/src/parser.c.o" "gcc" "CMakeFiles/dice.dir/src/parser.c.o.d"
+  "/root/package/src/rng.c" "CMakeFiles/dice.dir/src/rng.c.o" "gcc" "CMakeFiles/dice.dir/src/rng.c.o.d"
+  "/root/package/src/trace.c" "CMakeFiles/dice.dir/src/trace.c.o" "gcc" "CMakeFiles/dice.dir/src/trace.c.o.d"
+  "/root/package/src/visitor.c" "CMakeFiles/dice.dir/src/visitor.c.o" "gcc" "CMakeFiles/dice.dir/src/visitor.c.o.d"
+  )
+
+# Pairs of files generated by the same build rule.
+set(CMAKE_MULTIPLE_OUTPUT_PAIRS
+  "/root/package/build/libdice.so" "/root/package/build/libdice.so.1.0.0"
+  "/root/package/build/libdice.so.1" "/root/package/build/libdice.so.1.0.0"
+  )
+
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,27 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dice.dir/src/custom_dice.c.o"
+  "CMakeFiles/dice.dir/src/custom_dice.c.o.d"
+  "CMakeFiles/dice.dir/src/dice.c.o"
+  "CMakeFiles/dice.dir/src/dice.c.o.d"
+  "CMakeFiles/dice.dir/src/eval.c.o"
+  "CMakeFiles/dice.dir/src/eval.c.o.d"
+  "CMakeFiles/dice.dir/src/memory.c.o"
+  "CMakeFiles/dice.dir/src/memory.c.o.d"
+  "CMakeFiles/dice.dir/src/parser.c.o"
+  "CMakeFiles/dice.dir/src/parser.c.o.d"
+  "CMakeFiles/dice.dir/src/rng.c.o"
+  "CMakeFiles/dice.dir/src/rng.c.o.d"
+  "CMakeFiles/dice.dir/src/trace.c.o"
+  "CMakeFiles/dice.dir/src/trace.c.o.d"
+  "CMakeFiles/dice.dir/src/visitor.c.o"
+  "CMakeFiles/dice.dir/src/visitor.c.o.d"
+  "libdice.pdb"
+  "libdice.so"
+  "libdice.so.1"
+  "libdice.so.1.0.0"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/dice.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/roll.dir/src/cli/roll.c.o"
+  "CMakeFiles/roll.dir/src/cli/roll.c.o.d"
+  "roll"
+  "roll.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/roll.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
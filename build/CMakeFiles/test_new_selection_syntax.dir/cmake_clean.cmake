@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_new_selection_syntax.dir/tests/test_new_selection_syntax.c.o"
+  "CMakeFiles/test_new_selection_syntax.dir/tests/test_new_selection_syntax.c.o.d"
+  "test_new_selection_syntax"
+  "test_new_selection_syntax.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/test_new_selection_syntax.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
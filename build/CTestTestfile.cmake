@@ -0,0 +1,9 @@
+# CMake generated Testfile for 
+# Source directory: /root/package
+# Build directory: /root/package/build
+# 
+# This file includes the relevant testing commands required for 
+# testing this directory and lists subdirectories to be tested as well.
+add_test(new_selection_syntax_tests "/root/package/build/test_new_selection_syntax")
+set_tests_properties(new_selection_syntax_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/CMakeLists.txt;86;add_test;/root/package/CMakeLists.txt;0;")
+subdirs("tests")
@@ -0,0 +1,8 @@
+include(CMakeFindDependencyMacro)
+
+if(NOT TARGET Roll::dice)
+    include("${CMAKE_CURRENT_LIST_DIR}/RollTargets.cmake")
+endif()
+
+set(Roll_LIBRARIES Roll::dice)
+set(Roll_INCLUDE_DIRS "${CMAKE_CURRENT_LIST_DIR}/../../../include")
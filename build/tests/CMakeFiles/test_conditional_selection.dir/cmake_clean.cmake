@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_conditional_selection.dir/test_conditional_selection.c.o"
+  "CMakeFiles/test_conditional_selection.dir/test_conditional_selection.c.o.d"
+  "test_conditional_selection"
+  "test_conditional_selection.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/test_conditional_selection.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_dice.dir/test_dice.c.o"
+  "CMakeFiles/test_dice.dir/test_dice.c.o.d"
+  "test_dice"
+  "test_dice.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/test_dice.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_dice_core.dir/test_dice_core.c.o"
+  "CMakeFiles/test_dice_core.dir/test_dice_core.c.o.d"
+  "test_dice_core"
+  "test_dice_core.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/test_dice_core.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_dice_selection.dir/test_dice_selection.c.o"
+  "CMakeFiles/test_dice_selection.dir/test_dice_selection.c.o.d"
+  "test_dice_selection"
+  "test_dice_selection.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/test_dice_selection.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reroll.dir/test_reroll.c.o"
+  "CMakeFiles/test_reroll.dir/test_reroll.c.o.d"
+  "test_reroll"
+  "test_reroll.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/test_reroll.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
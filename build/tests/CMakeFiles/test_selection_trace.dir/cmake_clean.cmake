@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_selection_trace.dir/test_selection_trace.c.o"
+  "CMakeFiles/test_selection_trace.dir/test_selection_trace.c.o.d"
+  "test_selection_trace"
+  "test_selection_trace.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/test_selection_trace.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_visitor.dir/test_visitor.c.o"
+  "CMakeFiles/test_visitor.dir/test_visitor.c.o.d"
+  "test_visitor"
+  "test_visitor.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/test_visitor.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,32 @@
+# CMake generated Testfile for 
+# Source directory: /root/package/tests
+# Build directory: /root/package/build/tests
+# 
+# This file includes the relevant testing commands required for 
+# testing this directory and lists subdirectories to be tested as well.
+add_test(dice_core_tests "/root/package/build/tests/test_dice_core")
+set_tests_properties(dice_core_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;45;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(parser_tests "/root/package/build/tests/test_parser")
+set_tests_properties(parser_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;46;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(eval_tests "/root/package/build/tests/test_eval")
+set_tests_properties(eval_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;47;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(trace_tests "/root/package/build/tests/test_trace")
+set_tests_properties(trace_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;48;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(rng_tests "/root/package/build/tests/test_rng")
+set_tests_properties(rng_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;49;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(memory_tests "/root/package/build/tests/test_memory")
+set_tests_properties(memory_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;50;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(integration_tests "/root/package/build/tests/test_integration")
+set_tests_properties(integration_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;51;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(dice_selection_tests "/root/package/build/tests/test_dice_selection")
+set_tests_properties(dice_selection_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;52;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(conditional_selection_tests "/root/package/build/tests/test_conditional_selection")
+set_tests_properties(conditional_selection_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;53;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(reroll_tests "/root/package/build/tests/test_reroll")
+set_tests_properties(reroll_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;54;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(visitor_tests "/root/package/build/tests/test_visitor")
+set_tests_properties(visitor_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;55;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(selection_trace_tests "/root/package/build/tests/test_selection_trace")
+set_tests_properties(selection_trace_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;56;add_test;/root/package/tests/CMakeLists.txt;0;")
+add_test(legacy_dice_tests "/root/package/build/tests/test_dice")
+set_tests_properties(legacy_dice_tests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/tests/CMakeLists.txt;57;add_test;/root/package/tests/CMakeLists.txt;0;")
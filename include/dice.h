@@ -18,6 +18,7 @@ typedef struct dice_policy dice_policy_t;
 typedef struct dice_trace dice_trace_t;
 typedef struct dice_error_buffer dice_error_buffer_t;
 typedef struct dice_ast_visitor dice_ast_visitor_t;
+typedef struct dice_state dice_state_t;
 
 // =============================================================================
 // Core Types
@@ -319,7 +320,7 @@ int dice_roll(int sides);
  * @brief Roll multiple dice and return the sum
  * @param count Number of dice to roll
  * @param sides Number of sides on each die
- * @return Sum of all dice rolls
+ * @return Sum of all dice rolls, or -1 on error or if the sum exceeds INT_MAX
  */
 int dice_roll_multiple(int count, int sides);
 
@@ -328,10 +329,30 @@ int dice_roll_multiple(int count, int sides);
  * @param count Number of dice to roll
  * @param sides Number of sides on each die
  * @param results Array to store individual dice results (must be at least count elements)
- * @return Sum of all dice rolls
+ * @return Sum of all dice rolls, or -1 on error or if the sum exceeds INT_MAX
  */
 int dice_roll_individual(int count, int sides, int *results);
 
+/**
+ * @brief Roll a batch of identical dice in one call
+ * @param sides Number of sides on each die
+ * @param n Number of dice to roll
+ * @param out Array to store the results (must be at least n elements)
+ * @return 0 on success, -1 on error
+ * @note Unlike dice_roll_individual, no sum is computed, so large batches cannot overflow
+ */
+int dice_roll_batch(int sides, int n, int *out);
+
+/**
+ * @brief Roll one die per element of sides in one call
+ * @param sides Array of n side counts, one per die
+ * @param n Number of dice to roll
+ * @param out Array to store the results (must be at least n elements)
+ * @return 0 on success, -1 on error
+ * @note All side counts are validated before any dice are rolled
+ */
+int dice_roll_nd(const int *sides, int n, int *out);
+
 /**
  * @brief Roll dice using standard RPG notation with full EBNF expression support
  * @param dice_notation String representing dice notation
@@ -354,6 +375,92 @@ int dice_roll_quick(const char *dice_notation, uint32_t seed);
  */
 const char* dice_version(void);
 
+// =============================================================================
+// Stateful Simple API - Per-Handle RNG
+// =============================================================================
+
+/**
+ * @brief Create a dice state handle with its own seeded xoshiro256++ RNG
+ * @param seed Random seed (use 0 for time-based randomness)
+ * @return New state handle or NULL on failure
+ * @note Handles share no state, so each thread can roll on its own handle
+ *       without locking; a single handle must not be used concurrently
+ */
+dice_state_t* dice_state_create(uint32_t seed);
+
+/**
+ * @brief Destroy a dice state handle and free all resources
+ * @param state State handle to destroy
+ */
+void dice_state_destroy(dice_state_t *state);
+
+/**
+ * @brief Roll a single die using the handle's RNG
+ * @param state State handle
+ * @param sides Number of sides on the die (must be > 0)
+ * @return Random value between 1 and sides (inclusive), or -1 on error
+ */
+int dice_state_roll(dice_state_t *state, int sides);
+
+/**
+ * @brief Roll multiple dice using the handle's RNG and return the sum
+ * @param state State handle
+ * @param count Number of dice to roll
+ * @param sides Number of sides on each die
+ * @return Sum of all dice rolls, or -1 on error or if the sum exceeds INT_MAX
+ */
+int dice_state_roll_multiple(dice_state_t *state, int count, int sides);
+
+/**
+ * @brief Roll multiple dice using the handle's RNG and store individual results
+ * @param state State handle
+ * @param count Number of dice to roll
+ * @param sides Number of sides on each die
+ * @param results Array to store individual dice results (must be at least count elements)
+ * @return Sum of all dice rolls, or -1 on error or if the sum exceeds INT_MAX
+ */
+int dice_state_roll_individual(dice_state_t *state, int count, int sides, int *results);
+
+/**
+ * @brief Roll a batch of identical dice using the handle's RNG
+ * @param state State handle
+ * @param sides Number of sides on each die
+ * @param n Number of dice to roll
+ * @param out Array to store the results (must be at least n elements)
+ * @return 0 on success, -1 on error
+ */
+int dice_state_roll_batch(dice_state_t *state, int sides, int n, int *out);
+
+/**
+ * @brief Roll one die per element of sides using the handle's RNG
+ * @param state State handle
+ * @param sides Array of n side counts, one per die
+ * @param n Number of dice to roll
+ * @param out Array to store the results (must be at least n elements)
+ * @return 0 on success, -1 on error
+ * @note All side counts are validated before any dice are rolled
+ */
+int dice_state_roll_nd(dice_state_t *state, const int *sides, int n, int *out);
+
+/**
+ * @brief Roll several differently sized groups of dice in one call
+ * @param state State handle
+ * @param specs Flat array of (count, sides) pairs, 2 * n_specs elements
+ * @param n_specs Number of (count, sides) pairs
+ * @param sums Array to store the sum of each group (must be at least n_specs elements)
+ * @return Sum of all dice rolls, or -1 on error or if the sum could exceed INT_MAX
+ * @note All pairs, and the largest possible total, are validated before any dice are rolled
+ */
+int dice_state_roll_mixed(dice_state_t *state, const int *specs, int n_specs, int *sums);
+
+/**
+ * @brief Roll dice notation using the handle's RNG
+ * @param state State handle
+ * @param dice_notation String representing dice notation
+ * @return Result of the dice roll, or -1 on error
+ */
+int dice_state_roll_notation(dice_state_t *state, const char *dice_notation);
+
 // =============================================================================
 // Advanced API - Context Management
 // =============================================================================
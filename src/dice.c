@@ -1,11 +1,17 @@
 #include "dice.h"
 #include "internal.h"
+#include <limits.h>
 #include <stdlib.h>
 #include <string.h>
 #include <stdio.h>
 
 #define DICE_VERSION "2.0.0"
 
+// Arena for notation rolls: room for one term of the default policy's
+// max_dice_count dice with keep/drop (rolls, selection and trace entries),
+// so that policy, not the arena, is what limits the dice in a notation
+#define NOTATION_ARENA_SIZE (96 * 1024)
+
 // =============================================================================
 // Context Management
 // =============================================================================
@@ -157,26 +163,63 @@ int dice_roll(int sides) {
     return dice_roll_multiple(1, sides);
 }
 
-int dice_roll_multiple(int count, int sides) {
-    if (count <= 0 || sides <= 0) return -1;
+// Roll count dice with the context RNG, storing them in results if non-NULL
+static int roll_dice_sum(dice_context_t *ctx, int count, int sides, int *results) {
+    // Accumulate wide so a sum past INT_MAX is reported rather than wrapped
+    int64_t sum = 0;
+    for (int i = 0; i < count; i++) {
+        int roll = ctx->rng.roll(ctx->rng.state, sides);
+        if (roll < 0) return -1;
+        if (results) results[i] = roll;
+        sum += roll;
+        if (sum > INT_MAX) return -1;
+    }
+    return (int)sum;
+}
+
+// Fill out with n rolls from the context RNG, without summing
+static int roll_dice_batch(dice_context_t *ctx, int sides, int n, int *out) {
+    for (int i = 0; i < n; i++) {
+        int roll = ctx->rng.roll(ctx->rng.state, sides);
+        if (roll < 0) return -1;
+        out[i] = roll;
+    }
+    return 0;
+}
+
+// Fill out with one roll per entry of sides, rejecting any side count <= 0 up front
+static int roll_dice_nd(dice_context_t *ctx, const int *sides, int n, int *out) {
+    for (int i = 0; i < n; i++) {
+        if (sides[i] <= 0) return -1;
+    }
     
-    // Create temporary context for this operation
-    dice_context_t *ctx = dice_context_create(1024, DICE_FEATURE_BASIC);
-    if (!ctx) return -1;
+    for (int i = 0; i < n; i++) {
+        int roll = ctx->rng.roll(ctx->rng.state, sides[i]);
+        if (roll < 0) return -1;
+        out[i] = roll;
+    }
+    return 0;
+}
+
+// Create a temporary context with a time-seeded system RNG
+static dice_context_t* create_temporary_context(size_t arena_size, dice_features_t features) {
+    dice_context_t *ctx = dice_context_create(arena_size, features);
+    if (!ctx) return NULL;
     
     // Use time-based seed for randomness
     dice_rng_vtable_t rng = dice_create_system_rng(0);
     dice_context_set_rng(ctx, &rng);
+    return ctx;
+}
+
+int dice_roll_multiple(int count, int sides) {
+    if (count <= 0 || sides <= 0) return -1;
     
-    int sum = 0;
-    for (int i = 0; i < count; i++) {
-        int roll = ctx->rng.roll(ctx->rng.state, sides);
-        if (roll < 0) {
-            dice_context_destroy(ctx);
-            return -1;
-        }
-        sum += roll;
-    }
+    // Create temporary context for this operation
+    dice_context_t *ctx = create_temporary_context(1024, DICE_FEATURE_BASIC);
+    if (!ctx) return -1;
+    
+    int sum = roll_dice_sum(ctx, count, sides, NULL);
     
     dice_context_destroy(ctx);
     return sum;
@@ -186,39 +229,48 @@ int dice_roll_individual(int count, int sides, int *results) {
     if (count <= 0 || sides <= 0 || !results) return -1;
     
     // Create temporary context for this operation
-    dice_context_t *ctx = dice_context_create(1024, DICE_FEATURE_BASIC);
+    dice_context_t *ctx = create_temporary_context(1024, DICE_FEATURE_BASIC);
     if (!ctx) return -1;
     
-    // Use time-based seed for randomness
-    dice_rng_vtable_t rng = dice_create_system_rng(0);
-    dice_context_set_rng(ctx, &rng);
-    
-    int sum = 0;
-    for (int i = 0; i < count; i++) {
-        int roll = ctx->rng.roll(ctx->rng.state, sides);
-        if (roll < 0) {
-            dice_context_destroy(ctx);
-            return -1;
-        }
-        results[i] = roll;
-        sum += roll;
-    }
+    int sum = roll_dice_sum(ctx, count, sides, results);
     
     dice_context_destroy(ctx);
     return sum;
 }
 
+int dice_roll_batch(int sides, int n, int *out) {
+    if (n <= 0 || sides <= 0 || !out) return -1;
+    
+    // Create temporary context for this operation
+    dice_context_t *ctx = create_temporary_context(1024, DICE_FEATURE_BASIC);
+    if (!ctx) return -1;
+    
+    int status = roll_dice_batch(ctx, sides, n, out);
+    
+    dice_context_destroy(ctx);
+    return status;
+}
+
+int dice_roll_nd(const int *sides, int n, int *out) {
+    if (!sides || n <= 0 || !out) return -1;
+    
+    // Create temporary context for this operation
+    dice_context_t *ctx = create_temporary_context(1024, DICE_FEATURE_BASIC);
+    if (!ctx) return -1;
+    
+    int status = roll_dice_nd(ctx, sides, n, out);
+    
+    dice_context_destroy(ctx);
+    return status;
+}
+
 int dice_roll_notation(const char *dice_notation) {
     if (!dice_notation) return -1;
     
     // Create temporary context for this operation
-    dice_context_t *ctx = dice_context_create(4096, DICE_FEATURE_ALL);
+    dice_context_t *ctx = create_temporary_context(NOTATION_ARENA_SIZE, DICE_FEATURE_ALL);
     if (!ctx) return -1;
     
-    // Use time-based seed for randomness
-    dice_rng_vtable_t rng = dice_create_system_rng(0);
-    dice_context_set_rng(ctx, &rng);
-    
     dice_eval_result_t result = dice_roll_expression(ctx, dice_notation);
     
     int ret_val = -1;
@@ -234,7 +286,7 @@ int dice_roll_quick(const char *dice_notation, uint32_t seed) {
     if (!dice_notation) return -1;
     
     // Create temporary context for this operation
-    dice_context_t *ctx = dice_context_create(4096, DICE_FEATURE_ALL);
+    dice_context_t *ctx = dice_context_create(NOTATION_ARENA_SIZE, DICE_FEATURE_ALL);
     if (!ctx) return -1;
     
     // Use provided seed or time-based for randomness
@@ -250,4 +302,106 @@ int dice_roll_quick(const char *dice_notation, uint32_t seed) {
     
     dice_context_destroy(ctx);
     return ret_val;
+}
+
+// =============================================================================
+// Stateful Simple API
+// =============================================================================
+
+struct dice_state {
+    dice_context_t *ctx;
+};
+
+dice_state_t* dice_state_create(uint32_t seed) {
+    dice_state_t *state = malloc(sizeof(dice_state_t));
+    if (!state) return NULL;
+    
+    // Same arena and features as dice_roll_notation
+    state->ctx = dice_context_create(NOTATION_ARENA_SIZE, DICE_FEATURE_ALL);
+    if (!state->ctx) {
+        free(state);
+        return NULL;
+    }
+    
+    dice_rng_vtable_t rng = dice_create_xoshiro_rng(seed);
+    if (!rng.state) {
+        dice_state_destroy(state);
+        return NULL;
+    }
+    dice_context_set_rng(state->ctx, &rng);
+    
+    return state;
+}
+
+void dice_state_destroy(dice_state_t *state) {
+    if (!state) return;
+    
+    dice_context_destroy(state->ctx);
+    free(state);
+}
+
+int dice_state_roll(dice_state_t *state, int sides) {
+    return dice_state_roll_multiple(state, 1, sides);
+}
+
+int dice_state_roll_multiple(dice_state_t *state, int count, int sides) {
+    if (!state || count <= 0 || sides <= 0) return -1;
+    return roll_dice_sum(state->ctx, count, sides, NULL);
+}
+
+int dice_state_roll_individual(dice_state_t *state, int count, int sides, int *results) {
+    if (!state || count <= 0 || sides <= 0 || !results) return -1;
+    return roll_dice_sum(state->ctx, count, sides, results);
+}
+
+int dice_state_roll_batch(dice_state_t *state, int sides, int n, int *out) {
+    if (!state || n <= 0 || sides <= 0 || !out) return -1;
+    return roll_dice_batch(state->ctx, sides, n, out);
+}
+
+int dice_state_roll_nd(dice_state_t *state, const int *sides, int n, int *out) {
+    if (!state || !sides || n <= 0 || !out) return -1;
+    return roll_dice_nd(state->ctx, sides, n, out);
+}
+
+int dice_state_roll_mixed(dice_state_t *state, const int *specs, int n_specs, int *sums) {
+    if (!state || !specs || !sums || n_specs <= 0) return -1;
+    
+    // Reject the groups up front if even their largest possible total
+    // (count * sides summed) could pass INT_MAX
+    int64_t max_total = 0;
+    for (int i = 0; i < n_specs; i++) {
+        if (specs[2 * i] <= 0 || specs[2 * i + 1] <= 0) return -1;
+        max_total += (int64_t)specs[2 * i] * specs[2 * i + 1];
+        if (max_total > INT_MAX) return -1;
+    }
+    
+    int64_t total = 0;
+    for (int i = 0; i < n_specs; i++) {
+        int sum = roll_dice_sum(state->ctx, specs[2 * i], specs[2 * i + 1], NULL);
+        if (sum < 0) return -1;
+        sums[i] = sum;
+        total += sum;
+        if (total > INT_MAX) return -1;
+    }
+    return (int)total;
+}
+
+int dice_state_roll_notation(dice_state_t *state, const char *dice_notation) {
+    if (!state || !dice_notation) return -1;
+    
+    dice_context_t *ctx = state->ctx;
+    
+    // Rewind the arena, error and trace from the previous roll; unlike
+    // dice_context_reset this keeps the registered custom dice
+    ctx->arena_used = 0;
+    dice_clear_error(ctx);
+    memset(&ctx->trace, 0, sizeof(ctx->trace));
+    
+    dice_eval_result_t result = dice_roll_expression(ctx, dice_notation);
+    
+    if (result.success && !dice_has_error(ctx)) {
+        return (int)result.value;
+    }
+    return -1;
 }
\ No newline at end of file
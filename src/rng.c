@@ -50,7 +50,82 @@ dice_rng_vtable_t dice_create_system_rng(uint64_t seed) {
     return rng;
 }
 
-// Placeholder for xoshiro - just use system RNG for now
+// xoshiro256++ state - private to each generator, so no shared state between threads
+typedef struct {
+    uint64_t s[4];
+} xoshiro_rng_state_t;
+
+static uint64_t splitmix64_next(uint64_t *x) {
+    uint64_t z = (*x += 0x9E3779B97F4A7C15ULL);
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    return z ^ (z >> 31);
+}
+
+static uint64_t rotl64(uint64_t x, int k) {
+    return (x << k) | (x >> (64 - k));
+}
+
+static uint64_t xoshiro_next(xoshiro_rng_state_t *s) {
+    uint64_t result = rotl64(s->s[0] + s->s[3], 23) + s->s[0];
+    uint64_t t = s->s[1] << 17;
+    
+    s->s[2] ^= s->s[0];
+    s->s[3] ^= s->s[1];
+    s->s[1] ^= s->s[2];
+    s->s[0] ^= s->s[3];
+    s->s[2] ^= t;
+    s->s[3] = rotl64(s->s[3], 45);
+    
+    return result;
+}
+
+static int xoshiro_rng_init(void *state, uint64_t seed) {
+    xoshiro_rng_state_t *s = (xoshiro_rng_state_t*)state;
+    if (!s) return -1;
+    
+    // Time-based seeds also mix in the state address so generators created
+    // in the same second still get distinct streams
+    uint64_t x = seed ? seed : ((uint64_t)time(NULL) ^ (uint64_t)(uintptr_t)state);
+    for (int i = 0; i < 4; i++) {
+        s->s[i] = splitmix64_next(&x);
+    }
+    return 0;
+}
+
+static uint64_t xoshiro_rng_rand(void *state, uint64_t max) {
+    xoshiro_rng_state_t *s = (xoshiro_rng_state_t*)state;
+    if (max == 0) return 0;
+    
+    // Reject the low values that would bias the modulo
+    uint64_t threshold = (0 - max) % max;
+    uint64_t r;
+    do {
+        r = xoshiro_next(s);
+    } while (r < threshold);
+    return r % max;
+}
+
+static int xoshiro_rng_roll(void *state, int sides) {
+    if (sides <= 0) return -1;
+    return (int)xoshiro_rng_rand(state, (uint64_t)sides) + 1;
+}
+
+static void xoshiro_rng_cleanup(void *state) {
+    free(state);
+}
+
 dice_rng_vtable_t dice_create_xoshiro_rng(uint64_t seed) {
-    return dice_create_system_rng(seed);
+    xoshiro_rng_state_t *state = malloc(sizeof(xoshiro_rng_state_t));
+    
+    dice_rng_vtable_t rng = {
+        .init = xoshiro_rng_init,
+        .roll = xoshiro_rng_roll,
+        .rand = xoshiro_rng_rand,
+        .cleanup = xoshiro_rng_cleanup,
+        .state = state
+    };
+    
+    rng.init(state, seed);
+    return rng;
 }
\ No newline at end of file
@@ -1,4 +1,5 @@
 #include "test_common.h"
+#include <limits.h>
 
 // =============================================================================
 // Core Dice Operation Tests
@@ -99,6 +100,62 @@ int test_dice_roll_individual() {
     return 1;
 }
 
+int test_dice_roll_batch() {
+    
+    int results[100];
+    
+    // Test valid batch rolls
+    int status = dice_roll_batch(20, 100, results);
+    TEST_ASSERT(status == 0, "dice_roll_batch(20, 100) returns 0");
+    
+    int in_range = 1;
+    for (int i = 0; i < 100; i++) {
+        if (results[i] < 1 || results[i] > 20) in_range = 0;
+    }
+    TEST_ASSERT(in_range, "All batch results are between 1 and 20");
+    
+    // Test invalid inputs (negative tests)
+    status = dice_roll_batch(20, 100, NULL);
+    TEST_ASSERT(status == -1, "dice_roll_batch() with NULL output returns -1");
+    
+    status = dice_roll_batch(0, 100, results);
+    TEST_ASSERT(status == -1, "dice_roll_batch(0, 100) returns -1");
+    
+    status = dice_roll_batch(20, 0, results);
+    TEST_ASSERT(status == -1, "dice_roll_batch(20, 0) returns -1");
+    
+    return 1;
+}
+
+int test_dice_roll_nd() {
+    
+    int sides[] = {4, 6, 8, 10, 12, 20};
+    int results[6];
+    
+    // Test valid heterogeneous rolls
+    int status = dice_roll_nd(sides, 6, results);
+    TEST_ASSERT(status == 0, "dice_roll_nd() with six dice returns 0");
+    
+    int in_range = 1;
+    for (int i = 0; i < 6; i++) {
+        if (results[i] < 1 || results[i] > sides[i]) in_range = 0;
+    }
+    TEST_ASSERT(in_range, "Each nd result is between 1 and its die's sides");
+    
+    // Test invalid inputs (negative tests)
+    int bad_sides[] = {6, 0, 6};
+    status = dice_roll_nd(bad_sides, 3, results);
+    TEST_ASSERT(status == -1, "dice_roll_nd() with a 0-sided die returns -1");
+    
+    status = dice_roll_nd(sides, 0, results);
+    TEST_ASSERT(status == -1, "dice_roll_nd() with no dice returns -1");
+    
+    status = dice_roll_nd(sides, 6, NULL);
+    TEST_ASSERT(status == -1, "dice_roll_nd() with NULL output returns -1");
+    
+    return 1;
+}
+
 int test_dice_roll_notation() {
     
     // Test basic notation
@@ -140,6 +197,16 @@ int test_dice_roll_notation() {
     result = dice_roll_notation("d6");
     TEST_ASSERT(result >= 1 && result <= 6, "dice_roll_notation('d6') returns value between 1 and 6");
     
+    // The policy's max_dice_count, not the arena, limits a single term
+    result = dice_roll_notation("1000d6");
+    TEST_ASSERT(result >= 1000 && result <= 6000, "dice_roll_notation('1000d6') returns value between 1000 and 6000");
+    
+    result = dice_roll_notation("1000d6k1000");
+    TEST_ASSERT(result >= 1000 && result <= 6000, "dice_roll_notation('1000d6k1000') returns value between 1000 and 6000");
+    
+    result = dice_roll_notation("1001d6");
+    TEST_ASSERT(result == -1, "dice_roll_notation('1001d6') returns -1");
+    
     // Test invalid inputs (negative tests)
     result = dice_roll_notation(NULL);
     TEST_ASSERT(result == -1, "dice_roll_notation(NULL) returns -1");
@@ -249,6 +316,100 @@ int test_multiple_dice_uniformity() {
     return 1;
 }
 
+// =============================================================================
+// Stateful API Tests
+// =============================================================================
+
+int test_dice_state_api() {
+    
+    dice_state_t *state = dice_state_create(12345);
+    TEST_ASSERT(state != NULL, "dice_state_create() returns a handle");
+    
+    int result = dice_state_roll(state, 6);
+    TEST_ASSERT(result >= 1 && result <= 6, "dice_state_roll(6) returns value between 1 and 6");
+    
+    result = dice_state_roll_multiple(state, 3, 6);
+    TEST_ASSERT(result >= 3 && result <= 18, "dice_state_roll_multiple(3, 6) returns value between 3 and 18");
+    
+    int results[3];
+    int sum = dice_state_roll_individual(state, 3, 6, results);
+    TEST_ASSERT(sum == results[0] + results[1] + results[2], "dice_state_roll_individual() sum matches results");
+    
+    int batch[50];
+    TEST_ASSERT(dice_state_roll_batch(state, 20, 50, batch) == 0, "dice_state_roll_batch(20, 50) returns 0");
+    
+    int nd_sides[] = {6, 20};
+    int nd[2];
+    TEST_ASSERT(dice_state_roll_nd(state, nd_sides, 2, nd) == 0, "dice_state_roll_nd() returns 0");
+    TEST_ASSERT(nd[0] >= 1 && nd[0] <= 6 && nd[1] >= 1 && nd[1] <= 20, "dice_state_roll_nd() results match each die's sides");
+    
+    int specs[] = {3, 6, 1, 20, 2, 4};
+    int sums[3];
+    int total = dice_state_roll_mixed(state, specs, 3, sums);
+    TEST_ASSERT(sums[0] >= 3 && sums[0] <= 18, "dice_state_roll_mixed() 3d6 group sum between 3 and 18");
+    TEST_ASSERT(sums[1] >= 1 && sums[1] <= 20, "dice_state_roll_mixed() 1d20 group sum between 1 and 20");
+    TEST_ASSERT(sums[2] >= 2 && sums[2] <= 8, "dice_state_roll_mixed() 2d4 group sum between 2 and 8");
+    TEST_ASSERT(total == sums[0] + sums[1] + sums[2], "dice_state_roll_mixed() total matches group sums");
+    
+    result = dice_state_roll_notation(state, "2d6+3");
+    TEST_ASSERT(result >= 5 && result <= 15, "dice_state_roll_notation(\"2d6+3\") returns value between 5 and 15");
+    
+    // Custom dice registered at creation survive repeated notation rolls
+    for (int i = 0; i < 3; i++) {
+        result = dice_state_roll_notation(state, "4dF");
+        TEST_ASSERT(result >= -4 && result <= 4, "dice_state_roll_notation(\"4dF\") works on a reused handle");
+    }
+    
+    result = dice_state_roll_notation(state, "1000d6k1000");
+    TEST_ASSERT(result >= 1000 && result <= 6000, "dice_state_roll_notation(\"1000d6k1000\") returns value between 1000 and 6000");
+    
+    // Test invalid inputs (negative tests)
+    TEST_ASSERT(dice_state_roll(state, 0) == -1, "dice_state_roll(0) returns -1");
+    TEST_ASSERT(dice_state_roll_multiple(state, 0, 6) == -1, "dice_state_roll_multiple(0, 6) returns -1");
+    TEST_ASSERT(dice_state_roll_multiple(state, 100000, INT_MAX) == -1, "dice_state_roll_multiple() with a sum past INT_MAX returns -1");
+    TEST_ASSERT(dice_state_roll_individual(state, 3, 6, NULL) == -1, "dice_state_roll_individual() with NULL results returns -1");
+    TEST_ASSERT(dice_state_roll_batch(state, 20, 0, batch) == -1, "dice_state_roll_batch(20, 0) returns -1");
+    TEST_ASSERT(dice_state_roll_nd(state, NULL, 2, nd) == -1, "dice_state_roll_nd() with NULL sides returns -1");
+    int bad_specs[] = {3, 6, 0, 20};
+    TEST_ASSERT(dice_state_roll_mixed(state, bad_specs, 2, sums) == -1, "dice_state_roll_mixed() with a 0-count group returns -1");
+    TEST_ASSERT(dice_state_roll_mixed(state, specs, 0, sums) == -1, "dice_state_roll_mixed() with no groups returns -1");
+    int huge_specs[] = {1000000, 1000000, 1000000, 1000000};
+    TEST_ASSERT(dice_state_roll_mixed(state, huge_specs, 2, sums) == -1, "dice_state_roll_mixed() with a total past INT_MAX returns -1");
+    int wide_specs[] = {1, INT_MAX, 1, INT_MAX};
+    TEST_ASSERT(dice_state_roll_mixed(state, wide_specs, 2, sums) == -1, "dice_state_roll_mixed() with groups that only overflow together returns -1");
+    TEST_ASSERT(dice_state_roll_notation(state, "invalid") == -1, "dice_state_roll_notation(\"invalid\") returns -1");
+    TEST_ASSERT(dice_state_roll(NULL, 6) == -1, "dice_state_roll() with NULL handle returns -1");
+    
+    // A failed roll leaves the handle usable
+    result = dice_state_roll_notation(state, "1d20");
+    TEST_ASSERT(result >= 1 && result <= 20, "Handle works after a failed notation roll");
+    
+    dice_state_destroy(state);
+    dice_state_destroy(NULL);
+    
+    return 1;
+}
+
+int test_dice_state_reproducibility() {
+    
+    dice_state_t *state1 = dice_state_create(42);
+    dice_state_t *state2 = dice_state_create(42);
+    TEST_ASSERT(state1 && state2, "dice_state_create() returns handles");
+    
+    int matches = 1;
+    for (int i = 0; i < 100; i++) {
+        if (dice_state_roll(state1, 20) != dice_state_roll(state2, 20)) {
+            matches = 0;
+        }
+    }
+    TEST_ASSERT(matches, "Handles with the same seed roll the same sequence");
+    
+    dice_state_destroy(state1);
+    dice_state_destroy(state2);
+    
+    return 1;
+}
+
 // =============================================================================
 // Limit Tests
 // =============================================================================
@@ -280,9 +441,13 @@ int main() {
     RUN_TEST(test_dice_roll);
     RUN_TEST(test_dice_roll_multiple);
     RUN_TEST(test_dice_roll_individual);
+    RUN_TEST(test_dice_roll_batch);
+    RUN_TEST(test_dice_roll_nd);
     RUN_TEST(test_dice_roll_notation);
     RUN_TEST(test_dice_uniformity);
     RUN_TEST(test_multiple_dice_uniformity);
+    RUN_TEST(test_dice_state_api);
+    RUN_TEST(test_dice_state_reproducibility);
     RUN_TEST(test_dice_limits);
     
     printf("All core dice tests passed!\n");
@@ -101,6 +101,26 @@ int test_rng_reproducibility() {
     return 1;
 }
 
+int test_xoshiro_reproducibility() {
+    // Test that xoshiro keeps its own state: same seed, same sequence,
+    // even when both generators are interleaved
+    dice_rng_vtable_t rng1 = dice_create_xoshiro_rng(12345);
+    dice_rng_vtable_t rng2 = dice_create_xoshiro_rng(12345);
+    
+    int matches = 1;
+    for (int i = 0; i < 100; i++) {
+        if (rng1.roll(rng1.state, 100) != rng2.roll(rng2.state, 100)) {
+            matches = 0;
+        }
+    }
+    TEST_ASSERT(matches, "Same xoshiro seed produces same sequence");
+    
+    if (rng1.cleanup) rng1.cleanup(rng1.state);
+    if (rng2.cleanup) rng2.cleanup(rng2.state);
+    
+    return 1;
+}
+
 int test_rng_range_validation() {
     
     // Use context-based API for better randomness in statistical tests
@@ -300,6 +320,7 @@ int main() {
     RUN_TEST(test_rng_creation);
     RUN_TEST(test_rng_context_integration);
     RUN_TEST(test_rng_reproducibility);
+    RUN_TEST(test_xoshiro_reproducibility);
     RUN_TEST(test_rng_range_validation);
     RUN_TEST(test_rng_distribution_basic);
     RUN_TEST(test_rng_no_patterns);